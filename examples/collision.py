@@ -10,7 +10,7 @@ import pykep as pk
 from space_navigator.api import Environment
 from space_navigator.simulator import Simulator
 from space_navigator.agent import TableAgent, PytorchAgent
-from space_navigator.utils import read_environment, get_agent
+from space_navigator.utils import read_environment, get_agent, str2bool
 
 PROPAGATION_STEP = 0.000001
 
@@ -29,16 +29,16 @@ def main(args):
                         default="table", required=False)
 
     # simulator run args
-    parser.add_argument("-v", "--visualize", type=str,
-                        default="True", required=False)
+    parser.add_argument("-v", "--visualize", type=str2bool,
+                        default=True, required=False)
     parser.add_argument("-n_v", "--n_steps_vis", type=int,
                         default=1000, required=False)
-    parser.add_argument("-log", "--logging", type=str,
-                        default="True", required=False)
-    parser.add_argument("-e_s_prop", "--each_step_propagation", type=str,
-                        default="False", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="True", required=False)
+    parser.add_argument("-log", "--logging", type=str2bool,
+                        default=True, required=False)
+    parser.add_argument("-e_s_prop", "--each_step_propagation", type=str2bool,
+                        default=False, required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=True, required=False)
 
     args = parser.parse_args(args)
 
@@ -49,11 +49,11 @@ def main(args):
     agent_type = args.agent_type
 
     # simulator run args
-    visualize = args.visualize.lower() == "true"
+    visualize = args.visualize
     n_steps_vis = args.n_steps_vis
-    log = args.logging.lower() == "true"
-    each_step_propagation = args.each_step_propagation.lower() == "true"
-    print_out = args.print_out.lower() == "true"
+    log = args.logging
+    each_step_propagation = args.each_step_propagation
+    print_out = args.print_out
 
     # simulation
     env = read_environment(env_path)
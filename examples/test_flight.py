@@ -11,7 +11,7 @@ import pykep as pk
 from space_navigator.simulator import Simulator
 from space_navigator.api import Environment
 from space_navigator.agent import TableAgent
-from space_navigator.utils import read_space_objects
+from space_navigator.utils import read_space_objects, str2bool
 
 START_TIME = 6000
 SIMULATION_STEP = 0.000001
@@ -22,8 +22,8 @@ DEBRIS_NUM = 3
 
 def main(args):
     parser = argparse.ArgumentParser()
-    parser.add_argument("-v", "--visualize", type=str,
-                        default="True", required=False)
+    parser.add_argument("-v", "--visualize", type=str2bool,
+                        default=True, required=False)
     parser.add_argument("-start", "--start_time", type=float,
                         default=START_TIME, required=False)
     parser.add_argument("-end", "--end_time", type=float,
@@ -33,13 +33,13 @@ def main(args):
     parser.add_argument("-n_v", "--n_steps_vis", type=int,
                         default=1000, required=False,
                         help="the number of propagation steps in one step of visualization")
-    parser.add_argument("-p", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-p", "--print_out", type=str2bool,
+                        default=False, required=False)
 
     args = parser.parse_args(args)
 
-    visualize = args.visualize.lower() == "true"
-    print_out = args.print_out.lower() == "true"
+    visualize = args.visualize
+    print_out = args.print_out
     start_time, end_time = args.start_time, args.end_time
     step, n_steps_vis = args.step, args.n_steps_vis
 
@@ -8,3 +8,4 @@ from . import agent
 from . import models
 from . import utils
 from . import collision
+from . import propagation
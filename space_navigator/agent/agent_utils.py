@@ -20,20 +20,22 @@ def adjust_action_table(action_table):
         result_table = result_table[time_idx]
         if result_table.size:
             result_table[-1, -1] = np.nan
-            i = 0
-            while True:
-                if i == result_table.shape[0] - 1:
-                    break
-
-                if result_table[i, 3] == 0:
+            # single pass with a write cursor instead of np.delete per merge
+            n = 0  # number of kept actions
+            carry = np.zeros(4)  # merged action with zero time to next action
+            for i in range(result_table.shape[0] - 1):
+                action = result_table[i] + carry
+                carry = np.zeros(4)
+                if action[3] == 0:
                     # merge actions if time to next action == 0
-                    result_table[i + 1] += result_table[i]
-                    result_table = np.delete(result_table, i, axis=0)
-                elif np.count_nonzero(result_table[i, :3]) == 0 and i != 0:
+                    carry = action
+                elif np.count_nonzero(action[:3]) == 0 and n != 0:
                     # merge empty actions
-                    result_table[i - 1] += result_table[i]
-                    result_table = np.delete(result_table, i, axis=0)
+                    result_table[n - 1] += action
                 else:
-                    i += 1
+                    result_table[n] = action
+                    n += 1
+            result_table[n] = result_table[-1] + carry
+            result_table = result_table[:n + 1]
 
     return result_table
@@ -16,6 +16,8 @@ class TableAgent(BaseAgent):
         """
         self.action_table = adjust_action_table(action_table)
         self.action_idx = 0
+        # returned (without copying) when the table is over
+        self._inaction = np.array([0, 0, 0, np.nan])
 
     def get_action(self, state):
         """ Provides action for protected object.
@@ -35,12 +37,11 @@ class TableAgent(BaseAgent):
                 step in time when to request the next action (mjd2000).
 
         """
-        epoch = state["epoch"].mjd2000
-        if self.action_table.size and self.action_idx < self.action_table.shape[0]:
+        if self.action_idx < len(self.action_table):
             action = self.action_table[self.action_idx]
             self.action_idx += 1
         else:
-            action = np.array([0, 0, 0, np.nan])
+            action = self._inaction
         return action
 
     def get_action_table(self):
@@ -15,8 +15,10 @@ from copy import copy
 from .api_utils import (
     fuel_consumption, sum_coll_prob, reward_func,
     lower_estimate_of_time_to_conjunction, correct_angular_deviations,
+    mjd2000_to_epoch,
 )
 from ..collision import CollProbEstimator
+from ..propagation import propagate_batch
 
 MAX_FUEL_CONSUMPTION = 10
 
@@ -27,7 +29,7 @@ class Environment:
     def __init__(self, protected, debris, start_time, end_time,
                  coll_prob_thr=1e-4, fuel_cons_thr=10,
                  traj_dev_thr=(100, 0.01, 0.01, 0.01, 0.01, None),
-                 target_osculating_elements=None):
+                 target_osculating_elements=None, propagation_dtype=np.float64):
         """
         Args:
             protected (SpaceObject): protected space object in Environment.
@@ -46,6 +48,8 @@ class Environment:
             target_osculating_elements (tuple):
                 six osculating keplerian elements (a,e,i,W,w,M) of target orbit of protected object,
                 is equal to protected object osculating elements if None.
+            propagation_dtype (np.dtype): floating point type of debris propagation,
+                np.float32 is less precise, but faster (e.g. for rollouts).
 
         Note:
             Reward component is not taken into account, if threshold is None.
@@ -61,6 +65,7 @@ class Environment:
             protected=copy(protected), debris=copy(debris), start_time=start_time,
             end_time=end_time, coll_prob_thr=coll_prob_thr, fuel_cons_thr=fuel_cons_thr,
             traj_dev_thr=traj_dev_thr, target_osculating_elements=target_osculating_elements,
+            propagation_dtype=propagation_dtype,
         )
 
         self.protected = protected
@@ -75,7 +80,18 @@ class Environment:
             self.init_osculating_elements = target_osculating_elements
         self.trajectory_deviation = None
         self.n_debris = len(debris)
+        # debris are stored as arrays (SpaceObjects are kept for visualization)
+        self.debris_names = [d.get_name() for d in debris]
         self.debris_r = np.array([d.get_radius() for d in debris])
+        # debris states at start time for Keplerian propagation
+        self._debris_t0 = start_time.mjd2000
+        self._propagation_dtype = propagation_dtype
+        self._debris_rv0 = np.array(
+            [np.hstack(d.position(start_time)) for d in debris],
+            dtype=propagation_dtype).reshape((-1, 6))
+        self.debris_mu = np.array(
+            [d.get_mu_central_body() for d in debris], dtype=propagation_dtype)
+        self.debris_rv = np.copy(self._debris_rv0)
 
         self.next_action = pk.epoch(0, "mjd2000")
 
@@ -149,7 +165,7 @@ class Environment:
         s = 0
         while s < n_time_steps_plus_one:
             t = propagation_grid[s]
-            epoch = pk.epoch(t, "mjd2000")
+            epoch = mjd2000_to_epoch(t)
             st, debr = self.coords_by_epoch(epoch)
             coord = dict(st=st, debr=debr)
             self.state = dict(
@@ -176,6 +192,37 @@ class Environment:
 
         self._update_all_reward_components()
 
+    def step(self, end_time, step=10e-6, each_step_propagation=False):
+        """ Forward propagation followed by the environment statistics.
+
+        Args:
+            end_time (float): end time for propagation as mjd2000.
+            step (float): propagation time step.
+            each_step_propagation (bool): whether propagate for each step
+                or skip the steps using a lower estimation of the time to conjunction.
+
+        Returns:
+            stats (dict): see get_stats.
+
+        """
+        self.propagate_forward(end_time, step, each_step_propagation)
+        return self.get_stats()
+
+    def get_stats(self):
+        """Provides all the statistics updated by propagation and actions at once.
+
+        Returns:
+            stats (dict): dict with keys:
+                "coll_prob", "fuel", "traj_dev", "reward_components", "reward".
+        """
+        return {
+            "coll_prob": self.total_collision_probability,
+            "fuel": self.get_fuel_consumption(),
+            "traj_dev": self.trajectory_deviation,
+            "reward_components": self.reward_components,
+            "reward": self.reward,
+        }
+
     def _update_distances_and_probabilities_prior_to_current_conjunction(self, debr, dist):
         """ Update the distances and collision probabilities prior to current conjunction."""
         new_curr_dangerous_debris = np.copy(debr)
@@ -229,7 +276,7 @@ class Environment:
                     "probability": p,
                     "distance": self.min_distances_in_current_conjunction[d],
                     "epoch": self.state_for_min_distances_in_current_conjunction[d, 12],
-                    "debris_name": self.debris[d].get_name(),
+                    "debris_name": self.debris_names[d],
                     "debris_id": d,
                 })
                 coll_prob.append(p)
@@ -381,13 +428,40 @@ class Environment:
     def coords_by_epoch(self, epoch):
         st_pos, st_v = self.protected.position(epoch)
         st = np.hstack((np.array(st_pos), np.array(st_v)))[np.newaxis, ...]
-        n_items = len(self.debris)
-        debr = np.zeros((n_items, 6))
-        for i in range(n_items):
-            pos, v = self.debris[i].position(epoch)
-            debr[i] = np.array(pos + v)
+        debr = self.propagate_forward_batch(epoch.mjd2000)
         return st, debr
 
+    def propagate_forward_batch(self, mjd2000):
+        """ Propagation of all debris in one vectorized call.
+
+        Debris do not maneuver, so they are propagated from the start time.
+
+        Args:
+            mjd2000 (float): time for propagation as mjd2000.
+
+        Returns:
+            self.debris_rv (np.array with shape (n_debris, 6)): debris coordinates
+                (meters) and velocities (m/s) at given time.
+
+        """
+        self.debris_rv = self.debris_coords(mjd2000)
+        return self.debris_rv
+
+    def debris_coords(self, mjd2000):
+        """ Debris coordinates at given time, the environment state is not changed.
+
+        Args:
+            mjd2000 (float): time for propagation as mjd2000.
+
+        Returns:
+            debris_rv (np.array with shape (n_debris, 6)): debris coordinates
+                (meters) and velocities (m/s) at given time.
+
+        """
+        dt = (mjd2000 - self._debris_t0) * pk.DAY2SEC
+        return propagate_batch(
+            self._debris_rv0, dt, self.debris_mu, self._propagation_dtype)
+
     def collision_data(self):
         # TODO: add miss distance thr
         collision_data = []
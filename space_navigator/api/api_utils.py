@@ -1,7 +1,28 @@
+import functools
+
 import numpy as np
 import pykep as pk
 
 SEC_IN_DAY = 86400  # number of seconds in one day
+_EPOCH_CACHE_SIZE = 2**16
+_EPOCH_DECIMALS = 9  # 1e-9 days == 86.4 microseconds
+
+
+def mjd2000_to_epoch(mjd2000):
+    """ Provide pk.epoch for given time, repeated conversions are cached.
+
+    Args:
+        mjd2000 (float): time as mjd2000.
+
+    Returns:
+        pk.epoch: epoch for the time rounded to 1e-9 days.
+    """
+    return _cached_epoch(round(float(mjd2000), _EPOCH_DECIMALS))
+
+
+@functools.lru_cache(maxsize=_EPOCH_CACHE_SIZE)
+def _cached_epoch(mjd2000):
+    return pk.epoch(mjd2000, "mjd2000")
 
 
 def fuel_consumption(dV):
@@ -10,7 +10,7 @@ import matplotlib.pyplot as plt
 from ...api import Environment, MAX_FUEL_CONSUMPTION, fuel_consumption
 from ...simulator import Simulator
 from ...agent import TableAgent as Agent
-from ...utils import read_space_objects
+from ...utils import read_space_objects, load_action_table
 
 from ..base_model import BaseTableModel
 from ..train_utils import (
@@ -278,7 +278,7 @@ class CrossEntropy(BaseTableModel):
             self.policy_reward = self.get_reward()
 
     def set_action_table_from_path(self, model_path):
-        action_table = np.loadtxt(model_path, delimiter=',')
+        action_table = load_action_table(model_path)
         self.set_action_table(action_table)
 
     def _get_random_action_table(self, dV_angle):
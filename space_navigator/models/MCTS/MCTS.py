@@ -9,8 +9,12 @@ import time
 from ...api import Environment, MAX_FUEL_CONSUMPTION
 from ...simulator import Simulator
 from ...agent import TableAgent as Agent
+from ...utils import save_action_table
 
-from ..train_utils import generate_session, print_start_train, print_end_train
+from ..train_utils import (
+    generate_session, generate_sessions,
+    print_start_train, print_end_train,
+)
 
 
 def get_random_dV(fuel_cons):
@@ -94,12 +98,16 @@ def add_action_to_action_table(action_table, action):
 class DecisionTree:
     """MCTS based method for Reinforcement Learning."""
 
-    def __init__(self, env, step, max_time_to_req=0.05):
+    def __init__(self, env, step, max_time_to_req=0.05, n_workers=1, rollout_dtype=np.float32):
         """
         Agrs:
             env (Environment): environment with given parameteres.
             step (float): time step in simulation.
             max_time_to_req (float): maximum time for requesting the next maneuver.
+            n_workers (int): number of processes for evaluating the actions.
+            rollout_dtype (np.dtype): floating point type of debris propagation
+                in sessions for evaluating the actions (the final reward
+                of the action table is always calculated with np.float64).
 
         TODO:
             get_best_actions_if_current_passed_with_return using get_best_current_action_with_return.
@@ -119,6 +127,8 @@ class DecisionTree:
         self.investigated_time = self.start_time
         self.step = step
         self.max_time_to_req = max_time_to_req
+        self.n_workers = n_workers
+        self.rollout_dtype = rollout_dtype
 
         self.fuel_level = self.env.init_fuel
         self.action_table = np.empty((0, 4))
@@ -227,7 +237,6 @@ class DecisionTree:
             best_reward (float): reward of the session that contained the best action.
 
         """
-        best_reward = -float("inf")
         actions = get_random_actions(
             n_rnd_actions=n_iterations,
             max_time=self.max_time_to_req,
@@ -235,9 +244,8 @@ class DecisionTree:
             inaction=True,
             p_skip=0.1,  # ~percent of empty actions
             p_skip_coef=0)
-        for i in trange(n_iterations):
-            a = actions[i]
-            a_rewards = list()
+        sessions_args = []
+        for i in range(n_iterations):
             for j in range(n_eval):
                 eval_action_table = get_random_actions(
                     n_rnd_actions=n_steps_ahead,
@@ -245,16 +253,17 @@ class DecisionTree:
                     fuel_level=self.fuel_level,
                     inaction=False)
                 action_table = np.vstack(
-                    (self.action_table, a, eval_action_table))
+                    (self.action_table, actions[i], eval_action_table))
                 agent = Agent(action_table)
-                r = generate_session(
-                    self.protected, self.debris, agent, self.start_time, self.end_time, self.step)
-                a_rewards.append(r)
-            # TODO - try average reward
-            best_a_reward = np.max(a_rewards)
-            if best_a_reward > best_reward:
-                best_reward = best_a_reward
-                best_action = a
+                sessions_args.append((
+                    self.protected, self.debris, agent, self.start_time, self.end_time, self.step))
+        rewards = np.asarray(generate_sessions(
+            sessions_args, self.n_workers, dtype=self.rollout_dtype)).reshape(n_iterations, n_eval)
+        # TODO - try average reward
+        actions_rewards = rewards.max(axis=1)
+        best_idx = np.argmax(actions_rewards)
+        best_action = actions[best_idx]
+        best_reward = actions_rewards[best_idx]
 
         return best_action, best_reward
 
@@ -298,7 +307,8 @@ class DecisionTree:
                 (self.action_table, temp_action_table))
             agent = Agent(action_table)
             r = generate_session(
-                self.protected, self.debris, agent, self.start_time, self.end_time, self.step)
+                self.protected, self.debris, agent, self.start_time, self.end_time, self.step,
+                dtype=self.rollout_dtype)
             if r > best_reward:
                 best_reward = r
                 best_actions = temp_action_table
@@ -348,7 +358,8 @@ class DecisionTree:
                 (self.action_table, temp_action_table))
             agent = Agent(action_table)
             r = generate_session(
-                self.protected, self.debris, agent, self.start_time, self.end_time, self.step)
+                self.protected, self.debris, agent, self.start_time, self.end_time, self.step,
+                dtype=self.rollout_dtype)
             if r > best_reward:
                 best_action = temp_action_table[0]
                 best_next_actions = temp_action_table[1:]
@@ -366,5 +377,4 @@ class DecisionTree:
         return self.total_reward
 
     def save_action_table(self, path):
-        header = "dVx,dVy,dVz,time to request"
-        np.savetxt(path, self.action_table, delimiter=',', header=header)
+        save_action_table(path, self.action_table)
@@ -9,7 +9,7 @@ from .train_utils import generate_session_with_env, time_before_early_first_mane
 from ..api import Environment, MAX_FUEL_CONSUMPTION
 from ..simulator import Simulator
 from ..agent import TableAgent
-from ..utils import read_space_objects
+from ..utils import read_space_objects, save_action_table
 
 
 class BaseTableModel:
@@ -93,8 +93,7 @@ class BaseTableModel:
 
     def save_action_table(self, path):
         # TODO - save reward here?
-        header = "dVx,dVy,dVz,time to request"
-        np.savetxt(path, self.action_table, delimiter=',', header=header)
+        save_action_table(path, self.action_table)
 
     def print_start_train(self):
         print(f"\nStart training.\n\nInitial action table:\n{self.action_table}")
@@ -21,7 +21,7 @@ from ..train_utils import (
 class Baseline(BaseTableModel):
     """Provides prograde/retrograde maneuvers collision-by-collision."""
 
-    def __init__(self, env, step, reverse=True, first_maneuver_direction="auto"):
+    def __init__(self, env, step, reverse=True, first_maneuver_direction="auto", n_workers=1):
         """
         Agrs:
             env (Environment): environment with given parameteres.
@@ -35,6 +35,7 @@ class Baseline(BaseTableModel):
                     "forward" (co-directed)
                     "backward" (oppositely directed)
                     "auto" (just collinear).
+            n_workers (int): number of worker processes to evaluate maneuvers.
 
         TODO:
             tests - compare with CollinearGridSearch
@@ -49,6 +50,7 @@ class Baseline(BaseTableModel):
         self.first_maneuver_direction = first_maneuver_direction
         self.maneuvers_direction = first_maneuver_direction
         self._avoided_collisions = []
+        self.n_workers = n_workers
 
     def iteration(self, print_out=False, n_sessions=100):
         """Training iteration.
@@ -101,7 +103,7 @@ class Baseline(BaseTableModel):
             if print_out:
                 print("Training:")
             model_GS = CollinearGridSearch(
-                narrowed_env, self.step, False, self.maneuvers_direction)
+                narrowed_env, self.step, False, self.maneuvers_direction, self.n_workers)
             model_GS.train(1, False, n_sessions)
             action_table = model_GS.action_table
             is_action = len(action_table) > 0
@@ -2,7 +2,6 @@
 
 import numpy as np
 import pykep as pk
-from tqdm import trange
 import time
 
 from ...api import Environment, MAX_FUEL_CONSUMPTION
@@ -10,13 +9,13 @@ from ...simulator import Simulator
 from ...agent import TableAgent as Agent
 
 from ..base_model import BaseTableModel
-from ..train_utils import orbital_period_after_actions
+from ..train_utils import orbital_period_after_actions, generate_sessions_with_env
 
 
 class CollinearGridSearch(BaseTableModel):
     """Provides prograde/retrograde maneuvers through Grid Search."""
 
-    def __init__(self, env, step, reverse=True, first_maneuver_direction="auto"):
+    def __init__(self, env, step, reverse=True, first_maneuver_direction="auto", n_workers=1):
         """
         Agrs:
             env (Environment): environment with given parameteres.
@@ -30,6 +29,7 @@ class CollinearGridSearch(BaseTableModel):
                     "forward" (co-directed)
                     "backward" (oppositely directed)
                     "auto" (just collinear).
+            n_workers (int): number of worker processes to evaluate maneuvers.
         """
         super().__init__(env, step, reverse, first_maneuver_time="early")
 
@@ -37,6 +37,7 @@ class CollinearGridSearch(BaseTableModel):
         self.first_maneuver_direction = first_maneuver_direction
         self.first_action = np.array(
             [0, 0, 0, self.time_to_first_maneuver])
+        self.n_workers = n_workers
 
     def iteration(self, print_out=False, n_sessions=100):
         """Training iteration.
@@ -72,7 +73,8 @@ class CollinearGridSearch(BaseTableModel):
 
         dV_arr = np.vstack([V[i] * space for i in range(3)]).T
 
-        for i in trange(n_sessions):
+        action_tables = []
+        for i in range(n_sessions):
             dV = dV_arr[i]
             temp_action_table = np.vstack(
                 (self.first_action, np.hstack((dV, np.nan)))
@@ -84,11 +86,13 @@ class CollinearGridSearch(BaseTableModel):
                     (temp_action_table, -temp_action_table[-1])
                 )
                 temp_action_table[1, 3] = time_to_reverse
-
-            temp_reward = self.get_reward(temp_action_table)
-
-            if temp_reward > self.policy_reward:
-                self.policy_reward = temp_reward
-                self.action_table = temp_action_table
+            action_tables.append(temp_action_table)
+
+        rewards = generate_sessions_with_env(
+            [Agent(table) for table in action_tables], self.env, self.step, self.n_workers)
+        best_idx = np.argmax(rewards)
+        if rewards[best_idx] > self.policy_reward:
+            self.policy_reward = rewards[best_idx]
+            self.action_table = action_tables[best_idx]
 
         return stop
@@ -1,12 +1,15 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 import numpy as np
 import pykep as pk
 from copy import copy
+from tqdm import tqdm
 
 import matplotlib.pyplot as plt
 
-from ..api import Environment, fuel_consumption
+from ..api import Environment, fuel_consumption, mjd2000_to_epoch
 from ..simulator import Simulator
 from ..agent import TableAgent
 
@@ -55,7 +58,8 @@ def position_after_actions(action_table, env, step, epoch):
     return pos, vel
 
 
-def generate_session(protected, debris, agent, start_time, end_time, step, return_env=False):
+def generate_session(protected, debris, agent, start_time, end_time, step, return_env=False,
+                     dtype=np.float64):
     """Simulation.
 
     Args:
@@ -66,16 +70,18 @@ def generate_session(protected, debris, agent, start_time, end_time, step, retur
         end_time (float): end time of simulation provided as mjd2000.
         step (float): time step in simulation.
         return_env (bool): return the environment at the end of the session.
+        dtype (np.dtype): floating point type of debris propagation.
 
     Returns:
         reward: reward of the session.
 
     """
-    start_time_mjd2000 = pk.epoch(start_time, "mjd2000")
-    end_time_mjd2000 = pk.epoch(end_time, "mjd2000")
+    # rollouts share start and end times, so the epochs come from the cache
+    start_time_mjd2000 = mjd2000_to_epoch(start_time)
+    end_time_mjd2000 = mjd2000_to_epoch(end_time)
     protected_copy, debris_copy = copy(protected), copy(debris)
     env = Environment(protected_copy, debris_copy,
-                      start_time_mjd2000, end_time_mjd2000)
+                      start_time_mjd2000, end_time_mjd2000, propagation_dtype=dtype)
     simulator = Simulator(agent, env, step)
     reward = simulator.run(log=False)
     if return_env:
@@ -83,6 +89,57 @@ def generate_session(protected, debris, agent, start_time, end_time, step, retur
     return reward
 
 
+def _map_sessions(func, sessions_args, n_workers):
+    """Calls func for each arguments tuple, in worker processes if n_workers > 1.
+
+    Returns:
+        results (list): results in the order of sessions_args.
+
+    """
+    if n_workers == 1 or not sessions_args:
+        return [func(*args) for args in tqdm(sessions_args)]
+    chunksize = max(1, len(sessions_args) // (4 * n_workers))
+    with ProcessPoolExecutor(n_workers) as executor:
+        results = executor.map(
+            func, *zip(*sessions_args), chunksize=chunksize)
+        return list(tqdm(results, total=len(sessions_args)))
+
+
+def generate_sessions(sessions_args, n_workers=1, **kwargs):
+    """Plays several independent simulations.
+
+    Args:
+        sessions_args ([tuple, ]): generate_session arguments for each session.
+        n_workers (int): number of worker processes,
+            the sessions are played sequentially if 1.
+        **kwargs: generate_session keyword arguments common for all sessions.
+
+    Returns:
+        rewards (list): rewards of the sessions in the order of sessions_args.
+
+    """
+    session = partial(generate_session, **kwargs)
+    return _map_sessions(session, sessions_args, n_workers)
+
+
+def generate_sessions_with_env(agents, env, step, n_workers=1):
+    """Plays full simulations of several agents in the environment.
+
+    Args:
+        agents ([Agent, ]): agents to do actions.
+        env (Environment): environment to simulate sessions with.
+        step (float): time step in simulation.
+        n_workers (int): number of worker processes,
+            the sessions are played sequentially if 1.
+
+    Returns:
+        rewards (list): rewards of the sessions in the order of agents.
+
+    """
+    session = partial(generate_session_with_env, env=env, step=step)
+    return _map_sessions(session, [(agent,) for agent in agents], n_workers)
+
+
 def constrain_action(action, max_fuel_cons, min_time=None, max_time=None):
     """Changes the action in accordance with the restrictions.
 
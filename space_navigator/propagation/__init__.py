@@ -0,0 +1,2 @@
+from .kepler_jit import propagate_lagrangian, propagate_lagrangian_batch, NUMBA_AVAILABLE
+from .kepler import propagate_lagrangian_vectorized, propagate_batch
@@ -0,0 +1,132 @@
+# Module kepler provides vectorized Keplerian propagation
+# of many space objects at once (Lagrange coefficients, universal variable).
+
+import numpy as np
+import pykep as pk
+
+from .kepler_jit import (
+    MAX_ITERATIONS, TOLERANCE, NUMBA_AVAILABLE, propagate_lagrangian_batch,
+)
+
+# without numba, the vectorized propagation is slower
+# than the per-object one for fewer objects.
+VECTORIZED_MIN_OBJECTS = 20
+
+
+def stumpff_vectorized(z):
+    """ Stumpff functions C(z) and S(z) for array of z.
+
+    Args:
+        z (np.array): alpha * chi^2.
+
+    Returns:
+        C, S (np.array): Stumpff functions.
+    """
+    small = np.abs(z) < 1e-3
+    positive = z > 0
+    z_abs = np.where(small, 1., np.abs(z))
+    sz = np.sqrt(z_abs)
+    sz_cube = sz * z_abs
+    C = np.where(positive, 1 - np.cos(sz), np.cosh(sz) - 1) / z_abs
+    S = np.where(positive, sz - np.sin(sz), np.sinh(sz) - sz) / sz_cube
+    C = np.where(small, 1. / 2 - z / 24 + z * z / 720 - z * z * z / 40320, C)
+    S = np.where(small, 1. / 6 - z / 120 + z * z / 5040 - z * z * z / 362880, S)
+    return C, S
+
+
+def dtype_tolerance(dtype):
+    """ Tolerance of Newton's method, it can not converge better than the type precision. """
+    return max(TOLERANCE, 4 * float(np.finfo(dtype).eps))
+
+
+def propagate_lagrangian_vectorized(rv0, dt, mu):
+    """ Keplerian propagation of several objects in one vectorized call.
+
+    Args:
+        rv0 (np.array with shape (n_objects, 6)): initial positions (meters)
+            and velocities (m/s). Vectors format: (x,y,z,Vx,Vy,Vz).
+        dt (float): propagation time (seconds).
+        mu (np.array with shape (n_objects)): gravity parameters
+            of the central body for each object (m^3/s^2).
+
+    Returns:
+        rv (np.array with shape (n_objects, 6)): positions and velocities after dt,
+            computed in the floating point type of rv0.
+    """
+    tolerance = dtype_tolerance(rv0.dtype)
+    r0 = rv0[:, :3]
+    v0 = rv0[:, 3:]
+    r0_norm = np.sqrt(np.sum(r0 * r0, axis=1))
+    v0_sq = np.sum(v0 * v0, axis=1)
+    rv0_dot = np.sum(r0 * v0, axis=1)
+    sqrt_mu = np.sqrt(mu)
+    alpha = 2 / r0_norm - v0_sq / mu  # reciprocal of semi-major axis
+    dt = np.full_like(alpha, dt)
+
+    # the position is periodic for elliptic orbits
+    elliptic = alpha > 0
+    period = 2 * np.pi / (sqrt_mu * np.where(elliptic, alpha, 1.) ** 1.5)
+    dt = np.where(elliptic, dt % period, dt)
+
+    # universal Kepler equation by Newton's method
+    chi = np.where(elliptic, sqrt_mu * alpha * dt, sqrt_mu * dt / r0_norm)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        # logarithmic guess for hyperbolic orbits, see kepler_jit.propagate_lagrangian
+        sign = np.sign(dt)
+        inv_sqrt_alpha = 1 / np.sqrt(np.where(alpha < 0, -alpha, 1.))
+        x = -2 * mu * alpha * dt / (rv0_dot + sign * sqrt_mu * inv_sqrt_alpha * (1 - r0_norm * alpha))
+        hyperbolic = (alpha < 0) & (x > 0)
+        chi = np.where(hyperbolic, sign * inv_sqrt_alpha * np.log(np.where(hyperbolic, x, 1.)), chi)
+        for _ in range(MAX_ITERATIONS):
+            chi_sq = chi * chi
+            C, S = stumpff_vectorized(alpha * chi_sq)
+            F = (rv0_dot / sqrt_mu * chi_sq * C + (1 - alpha * r0_norm) * chi_sq * chi * S
+                 + r0_norm * chi - sqrt_mu * dt)
+            dF = (rv0_dot / sqrt_mu * chi * (1 - alpha * chi_sq * S)
+                  + (1 - alpha * r0_norm) * chi_sq * C + r0_norm)
+            ratio = F / dF
+            chi = chi - ratio
+            if np.all(np.abs(ratio) <= tolerance * np.maximum(1., np.abs(chi))):
+                break
+
+        chi_sq = chi * chi
+        C, S = stumpff_vectorized(alpha * chi_sq)
+    f = (1 - chi_sq / r0_norm * C)[:, None]
+    g = (dt - chi_sq * chi / sqrt_mu * S)[:, None]
+    r = f * r0 + g * v0
+    r_norm = np.sqrt(np.sum(r * r, axis=1))
+    f_dot = (sqrt_mu / (r_norm * r0_norm) * (alpha * chi_sq * chi * S - chi))[:, None]
+    g_dot = (1 - chi_sq / r_norm * C)[:, None]
+    v = f_dot * r0 + g_dot * v0
+    return np.concatenate((r, v), axis=1)
+
+
+def propagate_batch(rv0, dt, mu, dtype=np.float64):
+    """ Keplerian propagation of several objects with the fastest available method.
+
+    Args:
+        rv0 (np.array with shape (n_objects, 6)): initial positions (meters)
+            and velocities (m/s). Vectors format: (x,y,z,Vx,Vy,Vz).
+        dt (float): propagation time (seconds).
+        mu (np.array with shape (n_objects)): gravity parameters
+            of the central body for each object (m^3/s^2).
+        dtype (np.dtype): floating point type of propagation,
+            np.float32 halves the memory traffic at the cost of precision
+            (suitable for noisy estimations, e.g. rollouts).
+
+    Returns:
+        rv (np.array with shape (n_objects, 6)): positions and velocities after dt.
+    """
+    rv0 = rv0.astype(dtype, copy=False)
+    mu = mu.astype(dtype, copy=False)
+    if NUMBA_AVAILABLE:
+        return propagate_lagrangian_batch(rv0, dt, mu, dtype_tolerance(rv0.dtype))
+    if rv0.shape[0] >= VECTORIZED_MIN_OBJECTS:
+        return propagate_lagrangian_vectorized(rv0, dt, mu)
+    rv = np.empty_like(rv0)
+    for i in range(rv0.shape[0]):
+        r, v = pk.propagate_lagrangian(
+            rv0[i, :3].tolist(), rv0[i, 3:].tolist(), float(dt), float(mu[i]))
+        rv[i, :3] = r
+        rv[i, 3:] = v
+    return rv
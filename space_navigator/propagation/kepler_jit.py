@@ -0,0 +1,133 @@
+# Module kepler_jit provides Keplerian propagation of space objects
+# compiled with Numba (Lagrange coefficients, universal variable).
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # the propagation works without numba, just slower.
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-11
+
+
+@njit(cache=True)
+def stumpff(z):
+    """ Stumpff functions C(z) and S(z) of universal variable formulation.
+
+    Args:
+        z (float): alpha * chi^2.
+
+    Returns:
+        C, S (float): Stumpff functions.
+    """
+    if abs(z) < 1e-3:
+        C = 1. / 2 - z / 24 + z * z / 720 - z * z * z / 40320
+        S = 1. / 6 - z / 120 + z * z / 5040 - z * z * z / 362880
+    elif z > 0:
+        sz = math.sqrt(z)
+        C = (1 - math.cos(sz)) / z
+        S = (sz - math.sin(sz)) / (sz * sz * sz)
+    else:
+        sz = math.sqrt(-z)
+        C = (math.cosh(sz) - 1) / (-z)
+        S = (math.sinh(sz) - sz) / (sz * sz * sz)
+    return C, S
+
+
+@njit(cache=True)
+def propagate_lagrangian(r0, v0, dt, mu, tolerance=TOLERANCE):
+    """ Keplerian propagation of the state vector using Lagrange coefficients.
+
+    Args:
+        r0 (np.array with shape (3)): initial position (meters).
+        v0 (np.array with shape (3)): initial velocity (m/s).
+        dt (float): propagation time (seconds), could be negative.
+        mu (float): gravity parameter of the central body (m^3/s^2).
+        tolerance (float): relative tolerance of Newton's method.
+
+    Returns:
+        r, v (np.array with shape (3)): position (meters) and velocity (m/s) after dt.
+    """
+    r0_norm = math.sqrt(r0[0] * r0[0] + r0[1] * r0[1] + r0[2] * r0[2])
+    v0_sq = v0[0] * v0[0] + v0[1] * v0[1] + v0[2] * v0[2]
+    rv0 = r0[0] * v0[0] + r0[1] * v0[1] + r0[2] * v0[2]
+    sqrt_mu = math.sqrt(mu)
+    alpha = 2 / r0_norm - v0_sq / mu  # reciprocal of semi-major axis
+
+    if alpha > 0:
+        # the position is periodic for elliptic orbits
+        period = 2 * math.pi / (sqrt_mu * alpha ** 1.5)
+        dt = dt % period
+
+    # universal Kepler equation by Newton's method
+    chi = sqrt_mu * abs(alpha) * dt
+    if alpha <= 0:
+        chi = sqrt_mu * dt / r0_norm
+    if alpha < 0:
+        # logarithmic guess for hyperbolic orbits,
+        # Newton's method diverges from the linear one for long dt.
+        sign = 1. if dt >= 0 else -1.
+        x = -2 * mu * alpha * dt / (rv0 + sign * sqrt_mu / math.sqrt(-alpha) * (1 - r0_norm * alpha))
+        if x > 0:
+            chi = sign / math.sqrt(-alpha) * math.log(x)
+    for _ in range(MAX_ITERATIONS):
+        chi_sq = chi * chi
+        C, S = stumpff(alpha * chi_sq)
+        F = (rv0 / sqrt_mu * chi_sq * C + (1 - alpha * r0_norm) * chi_sq * chi * S
+             + r0_norm * chi - sqrt_mu * dt)
+        dF = (rv0 / sqrt_mu * chi * (1 - alpha * chi_sq * S)
+              + (1 - alpha * r0_norm) * chi_sq * C + r0_norm)
+        ratio = F / dF
+        chi -= ratio
+        if abs(ratio) <= tolerance * max(1., abs(chi)):
+            break
+
+    chi_sq = chi * chi
+    C, S = stumpff(alpha * chi_sq)
+    f = 1 - chi_sq / r0_norm * C
+    g = dt - chi_sq * chi / sqrt_mu * S
+    r = f * r0 + g * v0
+    r_norm = math.sqrt(r[0] * r[0] + r[1] * r[1] + r[2] * r[2])
+    f_dot = sqrt_mu / (r_norm * r0_norm) * (alpha * chi_sq * chi * S - chi)
+    g_dot = 1 - chi_sq / r_norm * C
+    v = f_dot * r0 + g_dot * v0
+    return r, v
+
+
+# not parallel: there are few debris, and the threading layer
+# of numba (OpenMP) does not survive forking of the worker processes.
+@njit(cache=True)
+def propagate_lagrangian_batch(rv0, dt, mu, tolerance=TOLERANCE):
+    """ Keplerian propagation of several objects.
+
+    Args:
+        rv0 (np.array with shape (n_objects, 6)): initial positions (meters)
+            and velocities (m/s). Vectors format: (x,y,z,Vx,Vy,Vz).
+        dt (float): propagation time (seconds).
+        mu (np.array with shape (n_objects)): gravity parameters
+            of the central body for each object (m^3/s^2).
+        tolerance (float): relative tolerance of Newton's method.
+
+    Returns:
+        rv (np.array with shape (n_objects, 6)): positions and velocities after dt,
+            in the floating point type of rv0.
+    """
+    n_objects = rv0.shape[0]
+    rv = np.empty_like(rv0)
+    for i in range(n_objects):
+        r, v = propagate_lagrangian(rv0[i, :3], rv0[i, 3:], dt, mu[i], tolerance)
+        rv[i, :3] = r
+        rv[i, 3:] = v
+    return rv
@@ -18,6 +18,7 @@ from mpl_toolkits.mplot3d import proj3d
 import pykep as pk
 from pykep.orbit_plots import plot_planet
 
+from ..api import mjd2000_to_epoch
 from ..agent import TableAgent
 from ..utils import is_action_table_empty, action_table2maneuver_table
 
@@ -30,6 +31,9 @@ PAUSE_ACTION_TIME = 4  # sc
 ARROW_LENGTH = 4e6  # meters
 EARTH_RADIUS = 6.3781e6  # meters
 
+# wireframe coordinates by (radius, centre), the grid is fixed
+_SPHERE_CACHE = {}
+
 
 def full_extent(ax, pad=0.0):
     """Get the full extent of an axes, including axes labels, tick labels, and
@@ -56,10 +60,14 @@ def draw_sphere(axis, centre, radius, wireframe_params={}):
     Returns:
        mpl_toolkits.mplot3d.art3d.Line3DCollection
     """
-    u, v = np.mgrid[0:2 * np.pi:20j, 0:np.pi:10j]
-    x = radius * np.cos(u) * np.sin(v) + centre[0]
-    y = radius * np.sin(u) * np.sin(v) + centre[1]
-    z = radius * np.cos(v) + centre[2]
+    key = (radius, tuple(centre))
+    if key not in _SPHERE_CACHE:
+        u, v = np.mgrid[0:2 * np.pi:20j, 0:np.pi:10j]
+        x = radius * np.cos(u) * np.sin(v) + centre[0]
+        y = radius * np.sin(u) * np.sin(v) + centre[1]
+        z = radius * np.cos(v) + centre[2]
+        _SPHERE_CACHE[key] = (x, y, z)
+    x, y, z = _SPHERE_CACHE[key]
     return axis.plot_wireframe(x, y, z, **wireframe_params)
 
 
@@ -79,10 +87,15 @@ def draw_action(axis, pos, dV):
 def strf_position(satellite, epoch):
     """ Print SpaceObject position at epoch. """
     pos, vel = satellite.position(epoch)
+    return strf_state(satellite.get_name(), pos, vel)
+
+
+def strf_state(name, pos, vel):
+    """ Print position and velocity of named object. """
     return "{} position: x - {:0.5f}, y - {:0.5f}, z - {:0.5f}.\
       \n{} velocity: Vx - {:0.5f}, Vy - {:0.5f}, Vz - {:0.5f}\
-      ".format(satellite.get_name(), pos[0], pos[1], pos[2],
-               satellite.get_name(), vel[0], vel[1], vel[2])
+      ".format(name, pos[0], pos[1], pos[2],
+               name, vel[0], vel[1], vel[2])
 
 
 class Visualizer:
@@ -90,45 +103,75 @@ class Visualizer:
         in real time.
     """
 
-    def __init__(self, curr_time, prob, fuel_cons, traj_dev, reward_components, reward, curr_alert_info):
+    def __init__(self, curr_time, prob, fuel_cons, traj_dev, reward_components, reward, curr_alert_info,
+                 n_points=1000):
+        """
+        Args:
+            n_points (int): expected number of data points for plots,
+                the data arrays grow if the number is exceeded.
+
+        """
         self.fig = plt.figure(figsize=[14, 12])
         self.gs = gridspec.GridSpec(15, 2)
         self.subplot_3d = self.fig.add_subplot(self.gs[:, 0], projection='3d')
-        self.subplot_3d.set_aspect("equal")
         self.subplot_p = self.fig.add_subplot(self.gs[:3, 1])
         self.subplot_f = self.fig.add_subplot(self.gs[4:7, 1])
         self.subplot_r_t = self.fig.add_subplot(self.gs[8:11, 1])
         self.subplot_r = self.fig.add_subplot(self.gs[12:, 1])
         # initialize data for plots
-        self.time_arr = [0]
-        self.prob_arr = [prob]
-        self.fuel_cons_arr = [fuel_cons]
+        n_points = max(1, n_points)
+        self.time_arr = np.empty(n_points)
+        self.prob_arr = np.empty(n_points)
+        self.fuel_cons_arr = np.empty(n_points)
+        self.r_traj_dev_arr = np.empty(n_points)
+        self.reward_arr = np.empty(n_points)
+        self._plot_i = 0
+        self._add_point(0, prob, fuel_cons, sum(traj_dev), reward)
         self.traj_dev = traj_dev
         self.reward_components = reward_components
-        self.r_traj_dev_arr = [sum(traj_dev)]
-        self.reward_arr = [reward]
         self.curr_alert_info = curr_alert_info
         # initialize zero action
         self.dV_plot = np.zeros(3)
+        self._debris_colors = None
 
     def run(self):
         plt.ion()
 
     def update_data(self, curr_time, prob, fuel_cons, traj_dev, reward_components, reward, curr_alert_info):
-        self.time_arr.append(curr_time)
-        self.prob_arr.append(prob)
-        self.fuel_cons_arr.append(fuel_cons)
+        self._add_point(curr_time, prob, fuel_cons,
+                        sum(reward_components["traj_dev"]), reward)
         self.traj_dev = traj_dev
         self.reward_components = reward_components
-        self.r_traj_dev_arr.append(sum(reward_components["traj_dev"]))
-        self.reward_arr.append(reward)
         self.curr_alert_info = curr_alert_info
 
+    def _add_point(self, curr_time, prob, fuel_cons, r_traj_dev, reward):
+        """ Write data point into preallocated arrays. """
+        i = self._plot_i
+        if i == self.time_arr.size:
+            # double the capacity
+            self.time_arr, self.prob_arr, self.fuel_cons_arr, self.r_traj_dev_arr, self.reward_arr = [
+                np.concatenate((arr, np.empty(arr.size))) for arr in (
+                    self.time_arr, self.prob_arr, self.fuel_cons_arr, self.r_traj_dev_arr, self.reward_arr)
+            ]
+        self.time_arr[i] = curr_time
+        self.prob_arr[i] = prob
+        self.fuel_cons_arr[i] = fuel_cons
+        self.r_traj_dev_arr[i] = r_traj_dev
+        self.reward_arr[i] = reward
+        self._plot_i += 1
+
     def plot_planet(self, satellite, t, size, color):
         """ Plot a pykep.planet object. """
         plot_planet(satellite, axes=self.subplot_3d,
                     t0=t, s=size, legend=(True, True), color=color)
 
+    def debris_colors(self, n_items):
+        """ Colors of debris, computed once for the number of debris. """
+        if self._debris_colors is None or len(self._debris_colors) != n_items:
+            cmap = plt.get_cmap('gist_rainbow')
+            self._debris_colors = cmap(np.linspace(0, 1, n_items))
+        return self._debris_colors
+
     def plot_earth(self):
         """ Add earth to the plot and legend. """
         draw_sphere(self.subplot_3d, (0, 0, 0), EARTH_RADIUS, {
@@ -153,9 +196,10 @@ class Visualizer:
         r_coll_prob = self.reward_components["coll_prob"]
         r_fuel = self.reward_components["fuel"]
         r_traj_dev = sum(self.reward_components["traj_dev"])
+        last = self._plot_i - 1
         s = f"""Epoch: {epoch}\n
-Collision Probability: {self.prob_arr[-1]:.5}.
-Fuel Consumption: {self.fuel_cons_arr[-1]:.5} (|dV|).
+Collision Probability: {self.prob_arr[last]:.5}.
+Fuel Consumption: {self.fuel_cons_arr[last]:.5} (|dV|).
 Trajectory Deviation:
     a: {self.traj_dev[0]:.5} (m);
     e: {self.traj_dev[1]:.5};
@@ -169,7 +213,7 @@ Reward Components:
     R Fuel Consumption: {r_fuel:.5};
     R Trajectory Deviation: {r_traj_dev:.5}.
 
-Total Reward: {self.reward_arr[-1]:.5}.
+Total Reward: {self.reward_arr[last]:.5}.
 """
         if self.curr_alert_info:
             s_alert = f"""Danger of collision!\n
@@ -187,13 +231,14 @@ Seconds before collision: {self.curr_alert_info["sec_before_collision"]}.
                                transform=self.subplot_3d.transAxes)
 
     def plot_graphics(self):
-        self.make_step_on_graph(self.subplot_p, self.time_arr, self.prob_arr,
+        n = self._plot_i
+        self.make_step_on_graph(self.subplot_p, self.time_arr[:n], self.prob_arr[:n],
                                 title='Total collision probability', ylabel='prob')
-        self.make_step_on_graph(self.subplot_f, self.time_arr, self.fuel_cons_arr,
+        self.make_step_on_graph(self.subplot_f, self.time_arr[:n], self.fuel_cons_arr[:n],
                                 title='Total fuel consumption', ylabel='fuel (dV)')
-        self.make_step_on_graph(self.subplot_r_t, self.time_arr, self.r_traj_dev_arr,
+        self.make_step_on_graph(self.subplot_r_t, self.time_arr[:n], self.r_traj_dev_arr[:n],
                                 title='R Trajectory Deviation', ylabel='reward')
-        self.make_step_on_graph(self.subplot_r, self.time_arr, self.reward_arr,
+        self.make_step_on_graph(self.subplot_r, self.time_arr[:n], self.reward_arr[:n],
                                 title='Total reward', ylabel='reward', xlabel='time (mjd2000)')
 
     def make_step_on_graph(self, ax, time, data, title, ylabel, xlabel=None):
@@ -227,13 +272,14 @@ Seconds before collision: {self.curr_alert_info["sec_before_collision"]}.
         subplot_r_t = fig.add_subplot(gs[8:11, 0])
         subplot_r = fig.add_subplot(gs[12:, 0])
 
-        self.make_step_on_graph(subplot_p, self.time_arr, self.prob_arr,
+        n = self._plot_i
+        self.make_step_on_graph(subplot_p, self.time_arr[:n], self.prob_arr[:n],
                                 title='Total collision probability', ylabel='prob')
-        self.make_step_on_graph(subplot_f, self.time_arr, self.fuel_cons_arr,
+        self.make_step_on_graph(subplot_f, self.time_arr[:n], self.fuel_cons_arr[:n],
                                 title='Total fuel consumption', ylabel='fuel (dV)')
-        self.make_step_on_graph(subplot_r_t, self.time_arr, self.r_traj_dev_arr,
+        self.make_step_on_graph(subplot_r_t, self.time_arr[:n], self.r_traj_dev_arr[:n],
                                 title='R Trajectory Deviation', ylabel='reward')
-        self.make_step_on_graph(subplot_r, self.time_arr, self.reward_arr,
+        self.make_step_on_graph(subplot_r, self.time_arr[:n], self.reward_arr[:n],
                                 title='Total reward', ylabel='reward', xlabel='time since simulation starts (mjd2000)')
 
         fig.savefig("simulation_graphics.png")
@@ -257,9 +303,10 @@ class Simulator:
         self.env = environment
         self.start_time = self.env.init_params["start_time"]
         self.end_time = self.env.init_params["end_time"]
-        self.curr_time = self.start_time
+        self.curr_mjd = self.start_time.mjd2000
 
         self.step = step
+        self._times = None
 
         self.vis = None
         self.logger = None
@@ -268,6 +315,11 @@ class Simulator:
         self.curr_alert = None
         self.json_log_path = None
 
+    @property
+    def curr_time(self):
+        """ Current simulation time as pk.epoch, built on demand. """
+        return mjd2000_to_epoch(self.curr_mjd)
+
     def run(self, visualize=False, n_steps_vis=1000, log=True, each_step_propagation=False,
             print_out=False, json_log=False, n_orbits_alert=1., json_log_path="json_log.json"):
         """
@@ -360,11 +412,65 @@ class Simulator:
             if print_out:
                 print("Preprocessing ended.\n")
 
-        if visualize:
+        if print_out:
+            self.print_start()
+            simulation_start_time = time.time()
+
+        if visualize or log or json_log:
+            self._run_full(visualize, n_steps_vis, log, each_step_propagation,
+                           json_log, n_orbits_alert, json_log_path)
+        else:
+            self._run_fast(each_step_propagation)
+
+        if print_out:
+            simulation_time = time.time() - simulation_start_time
+            self.print_end(simulation_time)
+
+        return self.env.get_reward()
+
+    def _run_fast(self, each_step_propagation):
+        """ Simulation without visualization and logging (e.g. for training).
 
-            self.vis = Visualizer(self.curr_time.mjd2000, self.env.get_total_collision_probability(),
-                                  self.env.get_fuel_consumption(), self.env.get_trajectory_deviation(),
-                                  self.env.get_reward_components(), self.env.get_reward(), self.curr_alert)
+        Args:
+            each_step_propagation (bool): whether propagate for each step
+                or skip the steps using a lower estimation of the time to conjunction.
+
+        """
+        env = self.env
+        propagate_forward = env.propagate_forward
+        get_action = self.agent.get_action
+        step = self.step
+        end_mjd = self.end_time.mjd2000
+        next_action_mjd = env.get_next_action().mjd2000
+
+        curr_mjd = self.curr_mjd
+        while True:
+            propagate_forward(curr_mjd, step, each_step_propagation)
+
+            if curr_mjd >= next_action_mjd:
+                env.act(get_action(env.get_state()))
+                next_action_mjd = env.get_next_action().mjd2000
+
+            if curr_mjd >= end_mjd:
+                break
+
+            if np.isnan(next_action_mjd) or next_action_mjd > end_mjd:
+                curr_mjd = end_mjd
+            else:
+                curr_mjd = next_action_mjd
+        self.curr_mjd = curr_mjd
+
+    def _run_full(self, visualize, n_steps_vis, log, each_step_propagation,
+                  json_log, n_orbits_alert, json_log_path):
+        """ Simulation with visualization and/or logging, see run. """
+        if visualize:
+            # initial point, one point per n_steps_vis steps and final point
+            n_points = int(np.ceil(
+                (self.end_time.mjd2000 - self.start_time.mjd2000) / self.step / n_steps_vis)) + 2
+            stats = self.env.get_stats()
+            self.vis = Visualizer(self.curr_mjd, stats["coll_prob"], stats["fuel"], stats["traj_dev"],
+                                  stats["reward_components"], stats["reward"], self.curr_alert,
+                                  n_points)
             self.vis.run()
             action = np.zeros(4)
             n_steps_since_vis = 1
@@ -377,23 +483,30 @@ class Simulator:
             json_log_iter = 0
             self.json_log_path = json_log_path
             self.log_json(json_log_iter, start=True)
+            # fixed time grid for step-by-step json logging
+            self._times = np.append(np.arange(
+                self.start_time.mjd2000, self.end_time.mjd2000, self.step), self.end_time.mjd2000)
+            time_idx = 0
 
-        if print_out:
-            self.print_start()
-            simulation_start_time = time.time()
+        end_mjd = self.end_time.mjd2000
+        # next action time changes only after env.act
+        next_action_mjd = self.env.get_next_action().mjd2000
 
         while True:
-            self.env.propagate_forward(
-                self.curr_time.mjd2000, self.step, each_step_propagation)
+            stats = self.env.step(
+                self.curr_mjd, self.step, each_step_propagation)
 
-            if self.curr_time.mjd2000 >= self.env.get_next_action().mjd2000:
+            if self.curr_mjd >= next_action_mjd:
                 s = self.env.get_state()
                 action = self.agent.get_action(s)
                 # TODO: assert: no actions without alert
                 err = self.env.act(action)
+                next_action_mjd = self.env.get_next_action().mjd2000
+                # fuel consumption changes with the maneuver
+                stats = self.env.get_stats()
 
                 if log:
-                    r = self.env.get_reward()
+                    r = stats["reward"]
                     if err:
                         self.log_bad_action(err, action)
                     self.log_reward_action(iteration, r, action)
@@ -408,18 +521,19 @@ class Simulator:
                 iteration += 1
 
             if visualize:
+                curr_epoch = self.curr_time
                 self.plot_protected()
                 self.plot_debris()
                 self.vis.plot_earth()
                 if n_steps_since_vis % n_steps_vis == 0:
-                    self.update_vis_data()
+                    self.update_vis_data(stats)
                     n_steps_since_vis = 1
 
-                self.vis.plot_iteration(self.curr_time)
+                self.vis.plot_iteration(curr_epoch)
                 self.vis.plot_graphics()
                 if np.not_equal(self.vis.dV_plot, np.zeros(3)).all():
                     self.vis.plot_action(
-                        self.env.protected.position(self.curr_time)[0], self.curr_time)
+                        self.env.protected.position(curr_epoch)[0], curr_epoch)
                     self.vis.pause(PAUSE_ACTION_TIME)
                 else:
                     self.vis.pause(PAUSE_TIME)
@@ -429,25 +543,22 @@ class Simulator:
                 self.log_json(json_log_iter)
                 json_log_iter += 1
 
-            if self.curr_time.mjd2000 >= self.end_time.mjd2000:
+            if self.curr_mjd >= end_mjd:
                 break
 
-            next_action_time = self.env.get_next_action().mjd2000
-
             if json_log:
-                next_time = pk.epoch(
-                    self.curr_time.mjd2000 + self.step, "mjd2000")
-            elif np.isnan(next_action_time) or next_action_time > self.end_time.mjd2000:
-                next_time = self.end_time
+                time_idx += 1
+                next_time = float(self._times[time_idx])
+            elif np.isnan(next_action_mjd) or next_action_mjd > end_mjd:
+                next_time = end_mjd
             else:
-                next_time = pk.epoch(next_action_time, "mjd2000")
+                next_time = next_action_mjd
 
             if visualize and not json_log:
-                n_steps_to_next_time = int(next_time.mjd2000 / self.step)
+                n_steps_to_next_time = int(next_time / self.step)
                 n_steps_to_next_vis = n_steps_vis - n_steps_since_vis
                 if n_steps_to_next_time > n_steps_to_next_vis:
-                    next_time = pk.epoch(
-                        self.curr_time.mjd2000 + n_steps_to_next_vis * self.step, "mjd2000")
+                    next_time = self.curr_mjd + n_steps_to_next_vis * self.step
                     n_steps_since_vis = n_steps_vis
                 else:
                     n_steps_since_vis += n_steps_to_next_time
@@ -455,57 +566,55 @@ class Simulator:
             if n_orbits_alert is not None:
                 self.curr_alert = self.curr_alert_info()
 
-            self.curr_time = next_time
+            self.curr_mjd = next_time
 
         if log:
             self.log_protected_position()
 
         if visualize:
-            self.update_vis_data()
+            self.update_vis_data(stats)
             self.vis.save_graphics()
 
-        if print_out:
-            simulation_time = time.time() - simulation_start_time
-            self.print_end(simulation_time)
-
         if json_log:
             self.log_json(json_log_iter, end=True)
 
-        return self.env.get_reward()
-
     def log_protected_position(self):
-        self.logger.info(strf_position(self.env.protected, self.curr_time))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(strf_position(
+                self.env.protected, self.curr_time))
 
     def log_debris_positions(self):
-        for obj in self.env.debris:
-            self.logger.info(strf_position(obj, self.curr_time))
+        if self.logger.isEnabledFor(logging.INFO):
+            debris_rv = self.env.debris_coords(self.curr_mjd)
+            for name, rv in zip(self.env.debris_names, debris_rv):
+                self.logger.info(strf_state(name, rv[:3], rv[3:]))
 
     def log_iteration(self, iteration):
-        self.logger.debug("Iter #{} \tEpoch: {} \tCollision Probability: {}".format(
-            iteration,  self.curr_time, self.env.total_collision_probability))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Iter #%s \tEpoch: %s \tCollision Probability: %s",
+                              iteration, self.curr_time, self.env.total_collision_probability)
 
     def log_reward_action(self, iteration, reward, action):
-        self.logger.info("Iter: {} \tReward: {} \taction: (dVx:{}, dVy: {}, dVz: {}, time_to_request: {})".format(
-            iteration, reward, *action))
+        self.logger.info("Iter: %s \tReward: %s \taction: (dVx:%s, dVy: %s, dVz: %s, time_to_request: %s)",
+                         iteration, reward, *action)
 
     def log_bad_action(self, message, action):
         self.logger.warning(
-            "Unable to make action (dVx:{}, dVy:{}, dVz:{}): {}".format(action[0], action[1], action[2], message))
+            "Unable to make action (dVx:%s, dVy:%s, dVz:%s): %s", action[0], action[1], action[2], message)
 
     def log_json(self, id, start=False, end=False):
         if start:
             with open(self.json_log_path, "w") as f:
                 f.write("{")
         else:
+            curr_epoch = self.curr_time
             point = {
-                "time_mjd2000": self.curr_time.mjd2000,
-                "epoch": str(self.curr_time),
-                "protected_pos": list(self.env.protected.position(self.curr_time)[0]),
+                "time_mjd2000": self.curr_mjd,
+                "epoch": str(curr_epoch),
+                "protected_pos": list(self.env.protected.position(curr_epoch)[0]),
             }
-            debris_pos = []
-            for d in self.env.debris:
-                debris_pos.append(list(d.position(self.curr_time)[0]))
-            point["debris_pos"] = debris_pos
+            debris_rv = self.env.debris_coords(self.curr_mjd)
+            point["debris_pos"] = debris_rv[:, :3].tolist()
             if self.alerts is not None:
                 point["alert"] = {
                     "is_alert": len(self.curr_alert) != 0,
@@ -521,7 +630,7 @@ class Simulator:
                 f.write(", ")
 
     def curr_alert_info(self):
-        curr_epoch = self.curr_time.mjd2000
+        curr_epoch = self.curr_mjd
         # TODO: all alerts info, not just about closest one
         while self.curr_alert_id < len(self.alerts):
             if self.alerts[self.curr_alert_id]["start_alert_epoch"] <= curr_epoch:
@@ -534,7 +643,7 @@ class Simulator:
                     info["probability"] = round(info["probability"], 8)
                     info["distance"] = round(info["distance"], 3)
                     info["sec_before_collision"] = round(
-                        86400 * (info["epoch"] - self.curr_time.mjd2000), 1)
+                        86400 * (info["epoch"] - self.curr_mjd), 1)
                     info["epoch"] = round(info["epoch"], 5)
                     info["debris_id"] = str(info["debris_id"])
                     return info
@@ -549,22 +658,24 @@ class Simulator:
 
     def plot_debris(self):
         """ Plot space debris. """
-        cmap = plt.get_cmap('gist_rainbow')
         n_items = len(self.env.debris)
-        colors = [cmap(i) for i in np.linspace(0, 1, n_items)]
+        colors = self.vis.debris_colors(n_items)
+        curr_epoch = self.curr_time
         for i in range(n_items):
             self.vis.plot_planet(
-                self.env.debris[i].satellite, t=self.curr_time,
+                self.env.debris[i].satellite, t=curr_epoch,
                 size=25, color=colors[i])
 
-    def update_vis_data(self):
+    def update_vis_data(self, stats=None):
+        if stats is None:
+            stats = self.env.get_stats()
         self.vis.update_data(
-            self.curr_time.mjd2000 - self.start_time.mjd2000,
-            self.env.get_total_collision_probability(),
-            self.env.get_fuel_consumption(),
-            self.env.get_trajectory_deviation(),
-            self.env.get_reward_components(),
-            self.env.get_reward(),
+            self.curr_mjd - self.start_time.mjd2000,
+            stats["coll_prob"],
+            stats["fuel"],
+            stats["traj_dev"],
+            stats["reward_components"],
+            stats["reward"],
             self.curr_alert)
 
     def print_start(self):
@@ -1,3 +1,6 @@
+import argparse
+import os
+
 import numpy as np
 import pykep as pk
 
@@ -122,7 +125,7 @@ def get_agent(agent_type, model_path='', num_inputs=6, num_outputs=4, hidden_siz
     """ ... """
     if agent_type == 'table':
         if model_path:
-            action_table = np.loadtxt(model_path, delimiter=',')
+            action_table = load_action_table(model_path)
             agent = TableAgent(action_table)
         else:
             agent = TableAgent()
@@ -135,6 +138,64 @@ def get_agent(agent_type, model_path='', num_inputs=6, num_outputs=4, hidden_siz
     return agent
 
 
+def str2bool(value):
+    """ Convert command line argument to bool.
+
+    Args:
+        value (str): "true"/"false" (or "yes"/"no", "1"/"0"),
+            case and surrounding whitespace are ignored.
+
+    Returns:
+        (bool): converted value.
+
+    Raises:
+        argparse.ArgumentTypeError: if value could not be converted.
+    """
+    value = value.strip().lower()
+    if value in ("true", "yes", "1"):
+        return True
+    if value in ("false", "no", "0"):
+        return False
+    raise argparse.ArgumentTypeError(f"boolean value expected, got: {value}")
+
+
+def save_action_table(path, action_table):
+    """ Save action table to csv file and its binary copy (.npy) alongside.
+
+    Args:
+        path (str): path to csv file.
+        action_table (np.array): table of actions with columns
+            ["dVx", "dVy", "dVz", "time to request"].
+    """
+    header = "dVx,dVy,dVz,time to request"
+    np.savetxt(path, action_table, delimiter=',', header=header)
+    np.save(os.path.splitext(path)[0] + ".npy", action_table)
+
+
+def load_action_table(path):
+    """ Load action table from csv file.
+
+    The binary copy (.npy) made by save_action_table is read instead of
+    parsing the csv file only if it is strictly newer than the csv file,
+    so the csv file takes precedence when the modification times are equal
+    (e.g. the csv file was edited within the file system time resolution).
+
+    Args:
+        path (str): path to csv file.
+
+    Returns:
+        action_table (np.array with shape=(n_actions, 4)): table of actions.
+    """
+    npy_path = os.path.splitext(path)[0] + ".npy"
+    if os.path.exists(npy_path) and (
+            not os.path.exists(path) or os.path.getmtime(npy_path) > os.path.getmtime(path)):
+        action_table = np.load(npy_path)
+    else:
+        action_table = np.loadtxt(path, delimiter=',')
+    # np.loadtxt returns shape (4) for one action and (0) for no actions
+    return action_table.reshape((-1, 4))
+
+
 def is_action_table_empty(action_table):
     return action_table.size == 0 or np.count_nonzero(action_table[:, :3]) == 0
 
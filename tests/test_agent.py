@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from space_navigator.agent import adjust_action_table
+
+
+class TestAgentUtils(unittest.TestCase):
+
+    def test_adjust_action_table(self):
+        # empty table
+        self.assertEqual(adjust_action_table(np.array([])).size, 0)
+
+        # single action
+        result = adjust_action_table(np.array([1, 2, 3, 0.1]))
+        want = np.array([[1, 2, 3, np.nan]])
+        self.assertTrue(np.allclose(result, want, equal_nan=True))
+
+        # merge actions with zero time to next action,
+        # merge empty actions, drop negative times
+        action_table = np.array([
+            [0, 0, 0, 0.1],
+            [1, 0, 0, 0],
+            [1, 1, 0, 0.2],
+            [0, 0, 0, 0.3],
+            [0, 0, 1, -1],
+            [2, 0, 0, 0.4],
+            [0, 1, 0, 0.5],
+        ])
+        want = np.array([
+            [0, 0, 0, 0.1],
+            [2, 1, 0, 0.5],
+            [2, 0, 0, 0.4],
+            [0, 1, 0, np.nan],
+        ])
+        result = adjust_action_table(action_table)
+        self.assertTrue(np.allclose(result, want, equal_nan=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
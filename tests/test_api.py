@@ -193,6 +193,31 @@ class TestEnvironment(unittest.TestCase):
             self.assertEqual(env.state["epoch"].mjd2000, end_time)
             env.reset()
 
+    def test_coords_by_epoch(self):
+        debris = []
+        for i, elements in enumerate([
+            (7800000, 0.001, 0.017453292519943295, 0, 0, 0.1),
+            (7000000, 0.01, 1.5, 0.3, 0.2, 2),
+            (8000000, 0.1, 0.5, 1, 3, 4),
+        ]):
+            params = dict(
+                elements=elements, epoch=self.start_time,
+                mu_central_body=398600800000000, mu_self=0.1,
+                radius=0.1, safe_radius=0.1, fuel=0,
+            )
+            debris.append(SpaceObject(f"debris{i}", "osc", params))
+        env = Environment(self.protected, debris, self.start_time, self.end_time)
+
+        for dt in [0, 0.001, 0.5, 3.7]:
+            epoch = pk.epoch(self.start_time.mjd2000 + dt, "mjd2000")
+            st, debr = env.coords_by_epoch(epoch)
+            self.assertEqual(st.shape, (1, 6))
+            self.assertEqual(debr.shape, (3, 6))
+            for d, rv in zip(debris, debr):
+                pos, vel = d.position(epoch)
+                self.assertTrue(np.allclose(rv[:3], pos, rtol=0, atol=1e-2))
+                self.assertTrue(np.allclose(rv[3:], vel, rtol=0, atol=1e-5))
+
     def test_update_distances_and_probabilities_prior_to_current_conjunction(self):
         # TODO: implement test after new approach will be added.
         self.assertTrue(True)
@@ -5,7 +5,10 @@ import pykep as pk
 import numpy as np
 
 from space_navigator.api import Environment, SpaceObject
-from space_navigator.models import time_before_first_collision, time_before_early_first_maneuver
+from space_navigator.agent import TableAgent
+from space_navigator.models import (
+    time_before_first_collision, time_before_early_first_maneuver, generate_sessions,
+)
 
 
 class TestTrainUtils(unittest.TestCase):
@@ -118,5 +121,20 @@ class TestTrainUtils(unittest.TestCase):
             time_before_early_first_maneuver(env, self.step, max_n_orbits),
             expected, 5)
 
+    def test_generate_sessions(self):
+        action_tables = [
+            np.empty((0, 4)),
+            np.array([[0, 0, 0, 0.5], [1, 0, 0, np.nan]]),
+            np.array([[0, 0, 0, 0.9], [0, -2, 1, np.nan]]),
+        ]
+        sessions_args = [
+            (self.protected, [self.debris], TableAgent(action_table),
+             self.start_time.mjd2000, self.end_time.mjd2000, self.step)
+            for action_table in action_tables
+        ]
+        rewards = generate_sessions(sessions_args)
+        self.assertEqual(len(rewards), len(action_tables))
+        self.assertEqual(generate_sessions(sessions_args, n_workers=2), rewards)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+import pykep as pk
+import numpy as np
+
+from space_navigator.propagation import (
+    propagate_lagrangian, propagate_lagrangian_batch, propagate_lagrangian_vectorized,
+    propagate_batch,
+)
+
+
+class TestKeplerJit(unittest.TestCase):
+
+    def setUp(self):
+        self.mu = pk.MU_EARTH
+        self.r0 = np.array([7.1e6, 1e5, -3e5])
+        self.v0 = np.array([100., 7800., 1500.])
+
+    def test_propagate_lagrangian(self):
+        for dt in [0, 100., 3000., -5000., 77760.]:
+            r, v = propagate_lagrangian(self.r0, self.v0, dt, self.mu)
+            r_pk, v_pk = pk.propagate_lagrangian(
+                list(self.r0), list(self.v0), dt, self.mu)
+            self.assertTrue(np.allclose(r, r_pk, rtol=0, atol=1e-3))
+            self.assertTrue(np.allclose(v, v_pk, rtol=0, atol=1e-6))
+
+    def test_propagate_lagrangian_period(self):
+        a = 7e6
+        r0 = np.array([a, 0, 0])
+        v0 = np.array([0, (self.mu / a)**0.5, 0])
+        period = 2 * np.pi * (a**3 / self.mu)**0.5
+        r, v = propagate_lagrangian(r0, v0, 3 * period, self.mu)
+        self.assertTrue(np.allclose(r, r0, rtol=0, atol=1e-3))
+        self.assertTrue(np.allclose(v, v0, rtol=0, atol=1e-6))
+
+    def test_propagate_lagrangian_hyperbolic(self):
+        r0 = np.array([7e6, 1e5, 0])
+        v0 = np.array([3000., 12000., 500.])
+        energy0 = v0 @ v0 / 2 - self.mu / np.linalg.norm(r0)
+        for dt in [-86400., 3000., 86400., 864000.]:
+            r, v = propagate_lagrangian(r0, v0, dt, self.mu)
+            energy = v @ v / 2 - self.mu / np.linalg.norm(r)
+            self.assertTrue(np.isclose(energy, energy0, rtol=1e-8, atol=0))
+            r_back, v_back = propagate_lagrangian(r, v, -dt, self.mu)
+            self.assertTrue(np.allclose(r_back, r0, rtol=0, atol=1e-2))
+
+    def test_propagate_lagrangian_batch(self):
+        rv0 = np.vstack([
+            np.hstack((self.r0, self.v0)),
+            np.hstack((-self.r0, self.v0)),
+        ])
+        mu = np.full(2, self.mu)
+        dt = 3000.
+        rv = propagate_lagrangian_batch(rv0, dt, mu)
+        for i in range(2):
+            r, v = propagate_lagrangian(rv0[i, :3], rv0[i, 3:], dt, self.mu)
+            self.assertTrue(np.allclose(rv[i], np.hstack((r, v))))
+
+        # no objects
+        rv = propagate_lagrangian_batch(np.empty((0, 6)), dt, np.empty(0))
+        self.assertEqual(rv.shape, (0, 6))
+
+        # float32 states
+        rv32 = propagate_lagrangian_batch(
+            rv0.astype(np.float32), dt, mu.astype(np.float32), 1e-6)
+        self.assertEqual(rv32.dtype, np.float32)
+        rv = propagate_lagrangian_batch(rv0, dt, mu)
+        self.assertTrue(np.allclose(rv32[:, :3], rv[:, :3], rtol=0, atol=100))
+
+
+class TestKepler(unittest.TestCase):
+
+    def setUp(self):
+        self.mu = pk.MU_EARTH
+        self.rv0 = np.array([
+            [7.1e6, 1e5, -3e5, 100., 7800., 1500.],
+            [-6.9e6, 2e5, 1e6, 500., -7000., 2000.],
+            [7e6, 0, 0, 0, 12000., 0],  # hyperbolic
+        ])
+
+    def test_propagate_lagrangian_vectorized(self):
+        mu = np.full(3, self.mu)
+        for dt in [0, 100., 3000., -5000., 77760., 864000.]:
+            rv = propagate_lagrangian_vectorized(self.rv0, dt, mu)
+            want = propagate_lagrangian_batch(self.rv0, dt, mu)
+            self.assertTrue(np.allclose(rv[:, :3], want[:, :3], rtol=0, atol=1e-3))
+            self.assertTrue(np.allclose(rv[:, 3:], want[:, 3:], rtol=0, atol=1e-6))
+
+        # no objects
+        rv = propagate_lagrangian_vectorized(np.empty((0, 6)), 1., np.empty(0))
+        self.assertEqual(rv.shape, (0, 6))
+
+    def test_propagate_batch_many_objects(self):
+        mu = np.full(3, self.mu)
+        n_copies = 10  # more objects than VECTORIZED_MIN_OBJECTS
+        dt = 3000.
+        rv = propagate_batch(np.tile(self.rv0, (n_copies, 1)), dt, np.tile(mu, n_copies))
+        want = propagate_batch(self.rv0, dt, mu)
+        self.assertEqual(rv.shape, (3 * n_copies, 6))
+        for i in range(n_copies):
+            self.assertTrue(np.allclose(rv[3 * i:3 * (i + 1), :3], want[:, :3], rtol=0, atol=1e-3))
+
+    def test_propagate_batch_float32(self):
+        mu = np.full(3, self.mu)
+        dt = 3000.
+        rv = propagate_batch(self.rv0, dt, mu, np.float32)
+        want = propagate_batch(self.rv0, dt, mu)
+        self.assertEqual(rv.dtype, np.float32)
+        self.assertEqual(want.dtype, np.float64)
+        self.assertTrue(np.allclose(rv[:, :3], want[:, :3], rtol=0, atol=100))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from space_navigator.utils import str2bool, save_action_table, load_action_table
+
+
+class TestUtils(unittest.TestCase):
+
+    def test_str2bool(self):
+        for value in ["true", "True", "TRUE", " yes ", "1"]:
+            self.assertIs(str2bool(value), True)
+        for value in ["false", "False", "no", "0 "]:
+            self.assertIs(str2bool(value), False)
+        for value in ["", "2", "t", "none"]:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                str2bool(value)
+
+    def test_save_load_action_table(self):
+        action_table = np.array([
+            [0, 0, 0, 0.1],
+            [1, 2, 3, np.nan],
+        ])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "action_table.csv")
+            save_action_table(path, action_table)
+            self.assertTrue(os.path.exists(os.path.join(tmp_dir, "action_table.npy")))
+            np.testing.assert_array_equal(load_action_table(path), action_table)
+
+            # the binary copy is read if it is newer than the csv file
+            np.savetxt(path, 2 * action_table, delimiter=',')
+            mtime = os.path.getmtime(path)
+            os.utime(path, (mtime - 10, mtime - 10))
+            np.testing.assert_array_equal(load_action_table(path), action_table)
+
+            # the csv file is read if it is not older
+            npy_mtime = os.path.getmtime(os.path.join(tmp_dir, "action_table.npy"))
+            os.utime(path, (npy_mtime, npy_mtime))
+            np.testing.assert_array_equal(load_action_table(path), 2 * action_table)
+            os.utime(path, (mtime + 10, mtime + 10))
+            np.testing.assert_array_equal(load_action_table(path), 2 * action_table)
+
+    def test_load_action_table_shape(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "action_table.csv")
+            for action_table in [np.array([[0, 0, 0, np.nan]]), np.empty((0, 4))]:
+                save_action_table(path, action_table)
+                self.assertEqual(load_action_table(path).shape, action_table.shape)
+                # without the binary copy
+                os.remove(os.path.join(tmp_dir, "action_table.npy"))
+                self.assertEqual(load_action_table(path).shape, action_table.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@
 import argparse
 import sys
 
-from space_navigator.utils import read_environment
+from space_navigator.utils import read_environment, str2bool
 from space_navigator.models.CE import CrossEntropy
 
 PROPAGATION_STEP = 0.000001
@@ -20,19 +20,19 @@ def main(args):
     parser.add_argument("-n_s", "--n_sessions", type=int,
                         default=30, required=False)
 
-    parser.add_argument("-r", "--reverse", type=str,
-                        default="True", required=False)
+    parser.add_argument("-r", "--reverse", type=str2bool,
+                        default=True, required=False)
     parser.add_argument("-f_man", "--first_maneuver_time", type=str,
                         default="early", required=False,
                         help="early or auto")
     parser.add_argument("-dv", "--dV_angle", type=str,
                         default="auto", required=False,
                         help="auto or complanar or collinear")
-    parser.add_argument("-low_r_step", "--step_if_low_reward", type=str,
-                        default="False", required=False,
+    parser.add_argument("-low_r_step", "--step_if_low_reward", type=str2bool,
+                        default=False, required=False,
                         help="step if new reward is lower than current")
-    parser.add_argument("-early_stop", "--early_stopping", type=str,
-                        default="True", required=False)
+    parser.add_argument("-early_stop", "--early_stopping", type=str2bool,
+                        default=True, required=False)
 
     parser.add_argument("-lr", "--learning_rate", type=float,
                         default=0.7, required=False)
@@ -54,19 +54,19 @@ def main(args):
     # output parameteres
     parser.add_argument("-save_path", "--save_action_table_path", type=str,
                         default="training/agents_tables/CE/action_table_CE.csv", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
-    parser.add_argument("-progress", "--show_progress", type=str,
-                        default="False", required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
+    parser.add_argument("-progress", "--show_progress", type=str2bool,
+                        default=False, required=False)
 
     args = parser.parse_args(args)
 
     # train parameters
     n_maneuvers, n_iterations, n_sessions = args.n_maneuvers, args.n_iterations, args.n_sessions
-    reverse = args.reverse.lower() == "true"
+    reverse = args.reverse
     first_maneuver_time, dV_angle = args.first_maneuver_time.lower(), args.dV_angle.lower()
-    step_if_low_reward = args.step_if_low_reward.lower() == "true"
-    early_stopping = args.early_stopping.lower() == "true"
+    step_if_low_reward = args.step_if_low_reward
+    early_stopping = args.early_stopping
     percentile, learning_rate = args.percentile, args.learning_rate
     sigma_decay, learning_rate_decay = args.sigma_decay, args.learning_rate_decay
     percentile_growth = args.percentile_growth
@@ -77,8 +77,8 @@ def main(args):
 
     # output parameteres
     save_action_table_path = args.save_action_table_path
-    print_out = args.print_out.lower() == "true"
-    show_progress = args.show_progress.lower() == "true"
+    print_out = args.print_out
+    show_progress = args.show_progress
 
     # create environment
     env = read_environment(env_path)
@@ -10,7 +10,7 @@ from space_navigator.api import MAX_FUEL_CONSUMPTION
 from space_navigator.api import Environment
 from space_navigator.models import ProgressPlotter
 from space_navigator.models.ES import EvolutionStrategies
-from space_navigator.utils import read_environment
+from space_navigator.utils import read_environment, str2bool
 
 
 PROPAGATION_STEP = 0.000001
@@ -35,10 +35,10 @@ def main(args):
                         default=0.5, required=False)
 
     # output parameteres
-    parser.add_argument("-progress", "--show_progress", type=str,
-                        default="False", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-progress", "--show_progress", type=str2bool,
+                        default=False, required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
     parser.add_argument("-out", "--output_path", type=str,
                         default=".", required=False, help="Output folder for progress plots.")
 
@@ -59,8 +59,8 @@ def main(args):
 
     step = args.step
     save_action_table_path = args.save_action_table_path
-    print_out = args.print_out.lower() == "true"
-    show_progress = args.show_progress.lower() == "true"
+    print_out = args.print_out
+    show_progress = args.show_progress
     output_path = args.output_path
 
     # create environment
@@ -2,13 +2,35 @@
 
 import argparse
 import sys
+from multiprocessing import Pool
 
-from space_navigator.utils import read_environment
+import numpy as np
+
+from space_navigator.utils import read_environment, str2bool
 from space_navigator.models.MCTS import DecisionTree
 
 PROPAGATION_STEP = 0.000001
 
 
+def train_tree(args):
+    """Trains an independent tree (root parallelization worker).
+
+    Args:
+        args (tuple): (seed, env_path, step, n_iterations, n_steps_ahead, n_eval, print_out).
+
+    Returns:
+        reward (float): reward of the trained action table.
+        action_table (np.array): trained action table.
+
+    """
+    seed, env_path, step, n_iterations, n_steps_ahead, n_eval, print_out = args
+    np.random.seed(seed)
+    env = read_environment(env_path)
+    model = DecisionTree(env, step)
+    model.train(n_iterations, n_steps_ahead, n_eval, print_out)
+    return model.get_reward(), model.get_action_table()
+
+
 def main(args):
     parser = argparse.ArgumentParser()
     parser.add_argument("-n_i", "--n_iterations", type=int,
@@ -21,10 +43,16 @@ def main(args):
                         default=PROPAGATION_STEP, required=False)
     parser.add_argument("-save_path", "--save_action_table_path", type=str,
                         default="training/agents_tables/MCTS/action_table_MCTS.csv", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
     parser.add_argument("-env", "--environment", type=str,
                         default="data/environments/collision.env", required=False)
+    parser.add_argument("-n_w", "--n_workers", type=int,
+                        default=1, required=False,
+                        help="number of independent trees trained in parallel")
+    parser.add_argument("-n_w_eval", "--n_workers_eval", type=int,
+                        default=1, required=False,
+                        help="number of processes evaluating the actions of a single tree")
 
     args = parser.parse_args(args)
 
@@ -32,15 +60,38 @@ def main(args):
     n_eval = args.n_random_sessions_for_eval_action
     step = args.step
     save_action_table_path = args.save_action_table_path
-    print_out = args.print_out.lower() == "true"
+    print_out = args.print_out
     env_path = args.environment
+    n_workers = max(1, min(args.n_workers, n_iterations))
+    n_workers_eval = args.n_workers_eval
+    if n_workers > 1 and n_workers_eval > 1:
+        # pool workers can not start processes
+        parser.error("-n_w and -n_w_eval can not be used together")
 
     # create environment
     env = read_environment(env_path)
 
     # MCTS
-    model = DecisionTree(env, step)
-    model.train(n_iterations, n_steps_ahead, n_eval, print_out)
+    model = DecisionTree(env, step, n_workers=n_workers_eval)
+    if n_workers == 1:
+        model.train(n_iterations, n_steps_ahead, n_eval, print_out)
+    else:
+        # root parallelization: independent trees with different seeds,
+        # the action table with the highest reward is chosen.
+        # the iterations are split between the trees.
+        workers_args = [
+            (seed, env_path, step, n_iterations // n_workers + (seed < n_iterations % n_workers),
+             n_steps_ahead, n_eval, print_out)
+            for seed in range(n_workers)
+        ]
+        with Pool(n_workers) as p:
+            trees = p.map(train_tree, workers_args)
+        rewards = [reward for reward, _ in trees]
+        model.action_table = trees[int(np.argmax(rewards))][1]
+        if print_out:
+            print(f"Rewards of {n_workers} trees: {rewards}")
+            print(f"Total Reward: {max(rewards)}")
+            print(f"Action Table:\n{model.action_table}")
     model.save_action_table(save_action_table_path)
 
     return
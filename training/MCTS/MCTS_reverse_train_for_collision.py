@@ -3,7 +3,7 @@
 import argparse
 import sys
 
-from space_navigator.utils import read_environment
+from space_navigator.utils import read_environment, str2bool
 from space_navigator.models.MCTS import DecisionTree
 
 PROPAGATION_STEP = 0.000001
@@ -17,8 +17,8 @@ def main(args):
                         default=PROPAGATION_STEP, required=False)
     parser.add_argument("-save_path", "--save_action_table_path", type=str,
                         default="training/agents_tables/MCTS/action_table_MCTS_with_reverse.csv", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
     parser.add_argument("-env", "--environment", type=str,
                         default="data/environments/collision.osc", required=False)
 
@@ -27,7 +27,7 @@ def main(args):
     n_iterations = args.n_iterations
     step = args.step
     save_action_table_path = args.save_action_table_path
-    print_out = args.print_out.lower() == "true"
+    print_out = args.print_out
     env_path = args.environment
 
     # create environment
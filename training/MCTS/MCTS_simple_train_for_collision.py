@@ -3,7 +3,7 @@
 import argparse
 import sys
 
-from space_navigator.utils import read_environment
+from space_navigator.utils import read_environment, str2bool
 from space_navigator.models.MCTS import DecisionTree
 
 PROPAGATION_STEP = 0.000001
@@ -17,24 +17,28 @@ def main(args):
                         default=PROPAGATION_STEP, required=False)
     parser.add_argument("-save_path", "--save_action_table_path", type=str,
                         default="training/agents_tables/MCTS/action_table_MCTS_simple.csv", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
     parser.add_argument("-env", "--environment", type=str,
                         default="data/environments/collision.env", required=False)
+    parser.add_argument("-n_w_eval", "--n_workers_eval", type=int,
+                        default=1, required=False,
+                        help="number of processes evaluating the actions")
 
     args = parser.parse_args(args)
 
     n_iterations = args.n_iterations
     step = args.step
     save_action_table_path = args.save_action_table_path
-    print_out = args.print_out.lower() == "true"
+    print_out = args.print_out
     env_path = args.environment
+    n_workers_eval = args.n_workers_eval
 
     # create environment
     env = read_environment(env_path)
 
     # MCTS
-    model = DecisionTree(env, step)
+    model = DecisionTree(env, step, n_workers=n_workers_eval)
     model.train(n_iterations, n_steps_ahead=0, print_out=print_out)
     model.save_action_table(save_action_table_path)
 
@@ -1,9 +1,10 @@
 # Train agent for collision at time 6600.
 
 import argparse
+import os
 import sys
 
-from space_navigator.utils import read_environment
+from space_navigator.utils import read_environment, str2bool
 from space_navigator.models.baseline import Baseline
 
 PROPAGATION_STEP = 0.000001
@@ -17,30 +18,33 @@ def main(args):
     parser.add_argument("-s", "--step", type=float,
                         default=PROPAGATION_STEP, required=False)
     # TODO - reverse default: True?
-    parser.add_argument("-r", "--reverse", type=str,
-                        default="False", required=False)
+    parser.add_argument("-r", "--reverse", type=str2bool,
+                        default=False, required=False)
 
     parser.add_argument("-save_path", "--save_action_table_path", type=str,
                         default="training/agents_tables/baseline/action_table_baseline.csv", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
     parser.add_argument("-env", "--environment", type=str,
                         default="data/environments/collision.env", required=False)
+    parser.add_argument("-n_w", "--n_workers", type=int,
+                        default=os.cpu_count(), required=False)
 
     args = parser.parse_args(args)
 
     n_sessions = args.n_sessions
     step = args.step
-    reverse = args.reverse.lower() == "true"
+    reverse = args.reverse
     save_action_table_path = args.save_action_table_path
-    print_out = args.print_out.lower() == "true"
+    print_out = args.print_out
     env_path = args.environment
+    n_workers = args.n_workers
 
     # create environment
     env = read_environment(env_path)
 
     # Baseline
-    model = Baseline(env, step, reverse)
+    model = Baseline(env, step, reverse, n_workers=n_workers)
     iteration_kwargs = {
         "n_sessions": n_sessions,
     }
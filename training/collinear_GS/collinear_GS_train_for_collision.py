@@ -3,7 +3,7 @@
 import argparse
 import sys
 
-from space_navigator.utils import read_environment
+from space_navigator.utils import read_environment, str2bool
 from space_navigator.models.collinear_GS import CollinearGridSearch
 
 PROPAGATION_STEP = 0.000001
@@ -16,13 +16,13 @@ def main(args):
                         default=100, required=False)
     parser.add_argument("-s", "--step", type=float,
                         default=PROPAGATION_STEP, required=False)
-    parser.add_argument("-r", "--reverse", type=str,
-                        default="True", required=False)
+    parser.add_argument("-r", "--reverse", type=str2bool,
+                        default=True, required=False)
 
     parser.add_argument("-save_path", "--save_action_table_path", type=str,
                         default="training/agents_tables/collinear_GS/action_table_collinear_GS.csv", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
     parser.add_argument("-env", "--environment", type=str,
                         default="data/environments/collision.env", required=False)
 
@@ -30,9 +30,9 @@ def main(args):
 
     n_sessions = args.n_sessions
     step = args.step
-    reverse = args.reverse.lower() == "true"
+    reverse = args.reverse
     save_action_table_path = args.save_action_table_path
-    print_out = args.print_out.lower() == "true"
+    print_out = args.print_out
     env_path = args.environment
 
     # create environment
@@ -5,7 +5,7 @@ import sys
 import os
 import pandas as pd
 
-from space_navigator.utils import read_environment
+from space_navigator.utils import read_environment, str2bool
 from space_navigator.agent.table_agent import TableAgent
 from space_navigator.simulator import Simulator
 
@@ -55,26 +55,26 @@ def save_result(model, name, dir_path, env, step):
 def main(args):
     parser = argparse.ArgumentParser()
 
-    parser.add_argument("-full", "--full_train", type=str,
-                        default="True", required=False)
+    parser.add_argument("-full", "--full_train", type=str2bool,
+                        default=True, required=False)
     parser.add_argument("-s", "--step", type=float,
                         default=PROPAGATION_STEP, required=False)
 
     parser.add_argument("-save_dir", "--save_action_table_dir", type=str,
                         default="vr/training/", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="False", required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=False, required=False)
     parser.add_argument("-env", "--environment", type=str,
                         default="vr/test.env", required=False)
 
     args = parser.parse_args(args)
 
-    full_train = args.full_train.lower() == "true"
+    full_train = args.full_train
     step = args.step
     save_action_table_dir = args.save_action_table_dir
     if not os.path.exists(save_action_table_dir):
         os.makedirs(save_action_table_dir)
-    print_out = args.print_out.lower() == "true"
+    print_out = args.print_out
     env_path = args.environment
 
     # create environment
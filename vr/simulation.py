@@ -10,7 +10,7 @@ import pykep as pk
 from space_navigator.api import Environment
 from space_navigator.simulator import Simulator
 from space_navigator.agent import TableAgent, PytorchAgent
-from space_navigator.utils import read_environment, get_agent
+from space_navigator.utils import read_environment, get_agent, str2bool
 
 PROPAGATION_STEP = 0.000001
 
@@ -29,10 +29,10 @@ def main(args):
                         default="table", required=False)
 
     # simulator run args
-    parser.add_argument("-log", "--logging", type=str,
-                        default="True", required=False)
-    parser.add_argument("-print", "--print_out", type=str,
-                        default="True", required=False)
+    parser.add_argument("-log", "--logging", type=str2bool,
+                        default=True, required=False)
+    parser.add_argument("-print", "--print_out", type=str2bool,
+                        default=True, required=False)
     parser.add_argument("-json_path", "---json_log_path", type=str,
                         default="vr/json_log.json", required=False)
 
@@ -45,8 +45,8 @@ def main(args):
     agent_type = args.agent_type
 
     # simulator run args
-    log = args.logging.lower() == "true"
-    print_out = args.print_out.lower() == "true"
+    log = args.logging
+    print_out = args.print_out
     json_log_path = args.json_log_path
 
     # simulation